@@ -1,10 +1,17 @@
 from __future__ import annotations
 
-from datetime import datetime, timezone
+from datetime import date, datetime, timedelta, timezone
 from difflib import SequenceMatcher
-import re
+from functools import lru_cache
+import string
 import unicodedata
 
+try:
+    from ciso8601 import parse_rfc3339 as _parse_rfc3339
+except ImportError:  # Optional speedup; datetime.fromisoformat covers every format.
+    _parse_rfc3339 = None
+
+
 TEAM_STOP_WORDS = {
     "ac",
     "afc",
@@ -26,6 +33,34 @@ TEAM_STOP_WORDS = {
 }
 
 
+class _SpaceFillTable(dict):
+    # str.translate table: listed code points map to themselves, everything else to a space.
+    def __missing__(self, codepoint: int) -> str:
+        self[codepoint] = " "
+        return " "
+
+
+_TEAM_NAME_TABLE = _SpaceFillTable(
+    {ord(ch): ch for ch in string.ascii_lowercase + string.digits + " "}
+)
+
+# Built once so diacritic stripping is a single translate() instead of a per-char call.
+_COMBINING_DROP_TABLE = {
+    codepoint: None
+    for codepoint in range(0x10000)
+    if unicodedata.combining(chr(codepoint))
+}
+
+_EPOCH_DATE = date(1970, 1, 1)
+
+
+# Token-overlap (Dice) bounds outside which team names are clearly the same/different.
+TOKEN_DICE_MATCH = 0.8
+TOKEN_DICE_MISMATCH = 0.3
+# A direct home/away score this high is accepted without scoring the swapped orientation.
+DIRECT_PAIR_ACCEPT = 0.9
+
+
 def utc_now_iso() -> str:
     return datetime.now(timezone.utc).isoformat().replace("+00:00", "Z")
 
@@ -33,17 +68,33 @@ def utc_now_iso() -> str:
 def parse_iso_utc(value: str | None) -> datetime | None:
     if not value:
         return None
+    return _parse_iso_utc_cached(value)
+
+
+@lru_cache(maxsize=8192)
+def _parse_iso_utc_cached(value: str) -> datetime | None:
+    # Datetimes are immutable, and providers repeat the same timestamps across rows.
     cleaned = value.strip()
     if not cleaned:
         return None
-    if cleaned.endswith("Z"):
-        cleaned = cleaned[:-1] + "+00:00"
-    try:
-        dt = datetime.fromisoformat(cleaned)
-    except ValueError:
-        return None
-    if dt.tzinfo is None:
-        dt = dt.replace(tzinfo=timezone.utc)
+    dt = None
+    if _parse_rfc3339 is not None:
+        try:
+            dt = _parse_rfc3339(cleaned)
+        except ValueError:
+            # Strict RFC 3339 rejects naive or minute-precision stamps; use the stdlib.
+            pass
+    if dt is None:
+        try:
+            # Python 3.11+ accepts a trailing "Z" directly.
+            dt = datetime.fromisoformat(cleaned)
+        except ValueError:
+            return None
+    offset = dt.utcoffset()
+    if offset is None:
+        return dt.replace(tzinfo=timezone.utc)
+    if not offset:
+        return dt if dt.tzinfo is timezone.utc else dt.replace(tzinfo=timezone.utc)
     return dt.astimezone(timezone.utc)
 
 
@@ -54,8 +105,7 @@ def epoch_ms_to_iso_utc(value: int | float | None) -> str | None:
         timestamp = float(value) / 1000.0
     except (TypeError, ValueError):
         return None
-    dt = datetime.fromtimestamp(timestamp, tz=timezone.utc)
-    return dt.isoformat().replace("+00:00", "Z")
+    return _format_epoch_seconds(timestamp)
 
 
 def epoch_seconds_to_iso_utc(value: int | float | None) -> str | None:
@@ -65,17 +115,38 @@ def epoch_seconds_to_iso_utc(value: int | float | None) -> str | None:
         timestamp = float(value)
     except (TypeError, ValueError):
         return None
-    dt = datetime.fromtimestamp(timestamp, tz=timezone.utc)
-    return dt.isoformat().replace("+00:00", "Z")
+    return _format_epoch_seconds(timestamp)
 
 
+def _format_epoch_seconds(timestamp: float) -> str:
+    whole = int(timestamp)
+    if whole != timestamp:
+        # Sub-second values keep the isoformat microsecond rendering.
+        dt = datetime.fromtimestamp(timestamp, tz=timezone.utc)
+        return dt.isoformat().replace("+00:00", "Z")
+    days, seconds = divmod(whole, 86400)
+    hours, seconds = divmod(seconds, 3600)
+    minutes, seconds = divmod(seconds, 60)
+    return f"{_epoch_day_iso(days)}T{hours:02d}:{minutes:02d}:{seconds:02d}Z"
+
+
+@lru_cache(maxsize=1024)
+def _epoch_day_iso(days: int) -> str:
+    return (_EPOCH_DATE + timedelta(days=days)).isoformat()
+
+
+@lru_cache(maxsize=8192)
 def normalize_team_name(name: str | None) -> str:
     if not name:
         return ""
-    text = unicodedata.normalize("NFKD", name)
-    text = "".join(ch for ch in text if not unicodedata.combining(ch))
-    text = text.lower()
-    text = re.sub(r"[^a-z0-9 ]+", " ", text)
+    if name.isascii():
+        # Nothing to decompose; most provider feeds already send plain ASCII names.
+        text = name.lower()
+    else:
+        text = unicodedata.normalize("NFKD", name)
+        text = text.translate(_COMBINING_DROP_TABLE)
+        text = text.lower()
+    text = text.translate(_TEAM_NAME_TABLE)
     parts = [p for p in text.split() if p and p not in TEAM_STOP_WORDS]
     if not parts:
         return ""
@@ -83,13 +154,56 @@ def normalize_team_name(name: str | None) -> str:
 
 
 def similarity(left: str | None, right: str | None) -> float:
-    left_norm = normalize_team_name(left)
-    right_norm = normalize_team_name(right)
+    return _normalized_similarity(normalize_team_name(left), normalize_team_name(right))
+
+
+@lru_cache(maxsize=16384)
+def _normalized_similarity(left_norm: str, right_norm: str) -> float:
     if not left_norm and not right_norm:
         return 1.0
     if not left_norm or not right_norm:
         return 0.0
-    return SequenceMatcher(None, left_norm, right_norm).ratio()
+    if left_norm == right_norm:
+        return 1.0
+    left_tokens = frozenset(left_norm.split())
+    right_tokens = frozenset(right_norm.split())
+    # Most pairs are clearly equal or clearly different at the token level; only
+    # the ambiguous band needs the (much slower) character-level Ratcliff/Obershelp.
+    dice = 2.0 * len(left_tokens & right_tokens) / (len(left_tokens) + len(right_tokens))
+    if dice >= TOKEN_DICE_MATCH:
+        return dice
+    if dice < TOKEN_DICE_MISMATCH and _signatures_far_apart(left_norm, right_norm):
+        return dice
+    # Spelling variants with no shared tokens ("olympiakos"/"olympiacos") pass the
+    # signature bound above and reach the full character ratio.
+    return SequenceMatcher(None, left_norm, right_norm, autojunk=False).ratio()
+
+
+@lru_cache(maxsize=8192)
+def _team_signature(norm: str) -> tuple[int, dict[str, int]]:
+    counts: dict[str, int] = {}
+    for ch in norm:
+        counts[ch] = counts.get(ch, 0) + 1
+    return len(norm), counts
+
+
+def _signatures_far_apart(left_norm: str, right_norm: str) -> bool:
+    # Both checks are upper bounds on the character ratio (the second is exactly what
+    # quick_ratio computes), so only pairs that cannot reach the mismatch band are pruned;
+    # abbreviations such as "man utd"/"manchester united" still get scored.
+    left_length, left_counts = _team_signature(left_norm)
+    right_length, right_counts = _team_signature(right_norm)
+    total = left_length + right_length
+    if 2.0 * min(left_length, right_length) / total < TOKEN_DICE_MISMATCH:
+        return True
+    if len(left_counts) > len(right_counts):
+        left_counts, right_counts = right_counts, left_counts
+    shared = 0
+    for ch, count in left_counts.items():
+        other = right_counts.get(ch)
+        if other:
+            shared += count if count < other else other
+    return 2.0 * shared / total < TOKEN_DICE_MISMATCH
 
 
 def team_pair_similarity(
@@ -98,8 +212,27 @@ def team_pair_similarity(
     home_b: str,
     away_b: str,
 ) -> tuple[float, bool]:
-    direct = (similarity(home_a, home_b) + similarity(away_a, away_b)) / 2.0
-    swapped = (similarity(home_a, away_b) + similarity(away_a, home_b)) / 2.0
+    return normalized_team_pair_similarity(
+        normalize_team_name(home_a),
+        normalize_team_name(away_a),
+        normalize_team_name(home_b),
+        normalize_team_name(away_b),
+    )
+
+
+@lru_cache(maxsize=100_000)
+def normalized_team_pair_similarity(
+    home_a: str,
+    away_a: str,
+    home_b: str,
+    away_b: str,
+) -> tuple[float, bool]:
+    # Expects normalize_team_name output, so callers can normalize each row once.
+    score = _normalized_similarity
+    direct = (score(home_a, home_b) + score(away_a, away_b)) / 2.0
+    if direct >= DIRECT_PAIR_ACCEPT:
+        return direct, False
+    swapped = (score(home_a, away_b) + score(away_a, home_b)) / 2.0
     if direct >= swapped:
         return direct, False
     return swapped, True
@@ -1,12 +1,21 @@
 from __future__ import annotations
 
+import base64
+import gzip
+from http.client import HTTPConnection, HTTPException, HTTPSConnection
 import json
-import re
 import ssl
+import threading
 from typing import Any
-from urllib.error import HTTPError, URLError
-from urllib.request import Request, urlopen
+from urllib.parse import SplitResult, unquote, urljoin, urlsplit
+from urllib.request import getproxies, proxy_bypass
 import os
+import zlib
+
+try:
+    import orjson
+except ImportError:  # Optional speedup; the stdlib parser also accepts bytes.
+    orjson = None
 
 from footballapi.normalize import epoch_ms_to_iso_utc, epoch_seconds_to_iso_utc, utc_now_iso
 
@@ -20,23 +29,51 @@ ESPN_SCOREBOARD_URL = "https://site.api.espn.com/apis/site/v2/sports/soccer/all/
 SOFASCORE_LIVE_URL = "https://www.sofascore.com/api/v1/sport/football/events/live"
 STREAMED_LIVE_URL = "https://streamed.pk/api/matches/live"
 
-GOAL_NEXT_DATA_PATTERN = re.compile(
-    r'<script id="__NEXT_DATA__" type="application/json">(.*?)</script>',
-    re.DOTALL,
-)
-ESPN_CLOCK_PATTERN = re.compile(r"(\d+)(?:\+(\d+))?")
+GOAL_NEXT_DATA_MARKER = 'id="__NEXT_DATA__"'
+
+# Shared read-only fallbacks for missing nested objects; never mutate these.
+_EMPTY: dict[str, Any] = {}
+_EMPTY_ROWS: tuple[dict[str, Any], ...] = (_EMPTY,)
+
+HTTP_REDIRECT_CODES = {301, 302, 303, 307, 308}
+HTTP_MAX_REDIRECTS = 5
 
 
 class ProviderError(RuntimeError):
     pass
 
 
+class _ConnectionPool:
+    # Idle keep-alive connections shared by every HttpClient, keyed by origin and TLS mode.
+    def __init__(self, max_idle_per_key: int = 4):
+        self.max_idle_per_key = max_idle_per_key
+        self._lock = threading.Lock()
+        self._idle: dict[tuple[str, str, bool], list[HTTPConnection]] = {}
+
+    def acquire(self, key: tuple[str, str, bool]) -> HTTPConnection | None:
+        with self._lock:
+            idle = self._idle.get(key)
+            return idle.pop() if idle else None
+
+    def release(self, key: tuple[str, str, bool], connection: HTTPConnection) -> None:
+        with self._lock:
+            idle = self._idle.setdefault(key, [])
+            if len(idle) < self.max_idle_per_key:
+                idle.append(connection)
+                return
+        connection.close()
+
+
+_CONNECTION_POOL = _ConnectionPool()
+
+
 class HttpClient:
     def __init__(self, timeout_seconds: float = 20.0, verify_tls: bool = True):
         self.timeout_seconds = timeout_seconds
         self.verify_tls = verify_tls
-        self._ssl_context = None
-        if not verify_tls:
+        if verify_tls:
+            self._ssl_context = ssl.create_default_context()
+        else:
             self._ssl_context = ssl._create_unverified_context()
 
     @classmethod
@@ -53,37 +90,162 @@ class HttpClient:
         return cls(verify_tls=verify)
 
     def get_text(self, url: str) -> str:
-        request = Request(
-            url=url,
-            headers={
-                "User-Agent": DEFAULT_USER_AGENT,
-                "Accept": "*/*",
-                "Accept-Encoding": "identity",
-            },
-        )
+        return self.get_bytes(url).decode("utf-8", errors="replace")
+
+    def get_bytes(self, url: str) -> bytes:
+        request_url = url
+        for _ in range(HTTP_MAX_REDIRECTS + 1):
+            try:
+                status, location, encoding, payload = self._send(urlsplit(request_url))
+            except TimeoutError as exc:
+                raise ProviderError(f"Timed out while requesting {url}") from exc
+            except (HTTPException, OSError) as exc:
+                raise ProviderError(f"Network error while requesting {url}: {exc}") from exc
+            if status in HTTP_REDIRECT_CODES and location:
+                request_url = urljoin(request_url, location)
+                continue
+            if status >= 400:
+                raise ProviderError(f"HTTP {status} while requesting {url}")
+            if encoding == "gzip":
+                try:
+                    payload = gzip.decompress(payload)
+                except (OSError, EOFError, zlib.error) as exc:
+                    raise ProviderError(f"Invalid gzip body from {url}: {exc}") from exc
+            return payload
+        raise ProviderError(f"Too many redirects while requesting {url}")
+
+    def _send(self, parts: SplitResult) -> tuple[int, str | None, str, bytes]:
+        # Providers are polled every cache cycle, so keep TLS sessions alive between pulls.
+        key = (parts.scheme, parts.netloc, self.verify_tls)
+        connection = _CONNECTION_POOL.acquire(key)
+        reused = connection is not None
+        if connection is None:
+            connection = self._connect(parts)
         try:
-            with urlopen(
-                request,
+            response = self._roundtrip(connection, parts)
+        except TimeoutError:
+            connection.close()
+            raise
+        except (HTTPException, OSError):
+            connection.close()
+            if not reused:
+                raise
+            # The server may have dropped an idle keep-alive connection; retry on a fresh one.
+            connection = self._connect(parts)
+            try:
+                response = self._roundtrip(connection, parts)
+            except (HTTPException, OSError):
+                connection.close()
+                raise
+        status, location, encoding, will_close, payload = response
+        if will_close:
+            connection.close()
+        else:
+            _CONNECTION_POOL.release(key, connection)
+        return status, location, encoding, payload
+
+    def _connect(self, parts: SplitResult) -> HTTPConnection:
+        host = parts.hostname or ""
+        port = parts.port
+        proxy = _proxy_for(parts)
+        if proxy is not None:
+            proxy_parts, proxy_headers = proxy
+            connection: HTTPConnection
+            if parts.scheme == "https":
+                connection = HTTPSConnection(
+                    proxy_parts.hostname or "",
+                    proxy_parts.port,
+                    timeout=self.timeout_seconds,
+                    context=self._ssl_context,
+                )
+                connection.set_tunnel(host, port, headers=proxy_headers)
+            else:
+                connection = HTTPConnection(
+                    proxy_parts.hostname or "",
+                    proxy_parts.port,
+                    timeout=self.timeout_seconds,
+                )
+            return connection
+        if parts.scheme == "https":
+            return HTTPSConnection(
+                host,
+                port,
                 timeout=self.timeout_seconds,
                 context=self._ssl_context,
-            ) as response:
-                payload = response.read()
-        except HTTPError as exc:
-            raise ProviderError(f"HTTP {exc.code} while requesting {url}") from exc
-        except URLError as exc:
-            raise ProviderError(f"Network error while requesting {url}: {exc}") from exc
-        except TimeoutError as exc:
-            raise ProviderError(f"Timed out while requesting {url}") from exc
-        return payload.decode("utf-8", errors="replace")
+            )
+        return HTTPConnection(host, port, timeout=self.timeout_seconds)
+
+    def _roundtrip(
+        self,
+        connection: HTTPConnection,
+        parts: SplitResult,
+    ) -> tuple[int, str | None, str, bool, bytes]:
+        connection.timeout = self.timeout_seconds
+        if connection.sock is not None:
+            connection.sock.settimeout(self.timeout_seconds)
+        target = parts.path or "/"
+        if parts.query:
+            target = f"{target}?{parts.query}"
+        headers = {
+            "User-Agent": DEFAULT_USER_AGENT,
+            "Accept": "*/*",
+            "Accept-Encoding": "gzip",
+        }
+        if parts.scheme == "http" and connection.host != parts.hostname:
+            # Plain-HTTP proxies expect the absolute URL as the request target.
+            target = parts.geturl()
+            proxy = _proxy_for(parts)
+            if proxy is not None:
+                headers.update(proxy[1])
+        connection.request("GET", target, headers=headers)
+        response = connection.getresponse()
+        payload = response.read()
+        return (
+            response.status,
+            response.getheader("Location"),
+            (response.getheader("Content-Encoding") or "").strip().lower(),
+            response.will_close,
+            payload,
+        )
 
     def get_json(self, url: str) -> Any:
-        text = self.get_text(url)
+        # Parse the raw body directly instead of decoding it to str first.
+        payload = self.get_bytes(url)
         try:
-            return json.loads(text)
-        except json.JSONDecodeError as exc:
+            return _loads_json(payload)
+        except ValueError as exc:
             raise ProviderError(f"Invalid JSON from {url}: {exc}") from exc
 
 
+def _proxy_for(parts: SplitResult) -> tuple[SplitResult, dict[str, str]] | None:
+    # Environment proxies as urlopen's ProxyHandler saw them, credentials included.
+    proxy = getproxies().get(parts.scheme)
+    if not proxy or proxy_bypass(parts.hostname or ""):
+        return None
+    proxy_parts = urlsplit(proxy if "://" in proxy else f"http://{proxy}")
+    headers: dict[str, str] = {}
+    if proxy_parts.username is not None:
+        credentials = f"{unquote(proxy_parts.username)}:{unquote(proxy_parts.password or '')}"
+        token = base64.b64encode(credentials.encode("utf-8")).decode("ascii")
+        headers["Proxy-Authorization"] = f"Basic {token}"
+    return proxy_parts, headers
+
+
+def _loads_json(payload: bytes | str) -> Any:
+    try:
+        if orjson is not None:
+            return orjson.loads(payload)
+        return json.loads(payload)
+    except ValueError:
+        if not isinstance(payload, bytes):
+            raise
+    # Byte parsing is strict about UTF-8; keep the old tolerance for stray invalid bytes.
+    text = payload.decode("utf-8", errors="replace")
+    if orjson is not None:
+        return orjson.loads(text)
+    return json.loads(text)
+
+
 def _to_int(value: Any) -> int | None:
     if value is None:
         return None
@@ -93,48 +255,66 @@ def _to_int(value: Any) -> int | None:
         return None
 
 
+GOAL_STATUS_MAP = {
+    "LIVE": "live",
+    "RESULT": "finished",
+    "FIXTURE": "scheduled",
+    "POSTPONED": "postponed",
+    "CANCELLED": "cancelled",
+}
+ESPN_STATE_MAP = {"in": "live", "post": "finished", "pre": "scheduled"}
+SOFASCORE_CODE_MAP = {
+    **{code: "scheduled" for code in (1, 2, 3, 4, 5)},
+    **{code: "live" for code in (6, 7, 8, 9, 10, 31, 32, 33)},
+    **{code: "finished" for code in (100, 120)},
+}
+
+
+def _digits_end(text: str, start: int) -> int:
+    end = start
+    length = len(text)
+    while end < length and text[end].isdecimal():
+        end += 1
+    return end
+
+
+def _parse_espn_clock(display_clock: str) -> tuple[int | None, int | None]:
+    # Hand-rolled equivalent of searching r"(\d+)(?:\+(\d+))?" in "77'" / "90+3'" clocks.
+    length = len(display_clock)
+    start = 0
+    while start < length and not display_clock[start].isdecimal():
+        start += 1
+    if start == length:
+        return None, None
+    end = _digits_end(display_clock, start)
+    minute = int(display_clock[start:end])
+    if end + 1 < length and display_clock[end] == "+" and display_clock[end + 1].isdecimal():
+        return minute, int(display_clock[end + 1 : _digits_end(display_clock, end + 1)])
+    return minute, None
+
+
 def _goal_status(raw: str | None) -> str:
-    normalized = (raw or "").strip().upper()
-    if normalized == "LIVE":
-        return "live"
-    if normalized == "RESULT":
-        return "finished"
-    if normalized == "FIXTURE":
-        return "scheduled"
-    if normalized == "POSTPONED":
-        return "postponed"
-    if normalized == "CANCELLED":
-        return "cancelled"
-    return "unknown"
+    return GOAL_STATUS_MAP.get((raw or "").strip().upper(), "unknown")
 
 
 def _espn_status(status_type: dict[str, Any] | None) -> str:
     status_type = status_type or {}
-    name = str(status_type.get("name") or "").upper()
     state = str(status_type.get("state") or "").lower()
-    description = str(status_type.get("description") or "").lower()
-    short_detail = str(status_type.get("shortDetail") or "").lower()
-    haystack = f"{name} {state} {description} {short_detail}"
-
+    # Postponements/cancellations surface in the free-text fields and override state.
+    # The upper-cased "name" can never contain these lower-case needles, so it is skipped.
+    haystack = (
+        f"{state} {status_type.get('description') or ''} {status_type.get('shortDetail') or ''}"
+    ).lower()
     if "postponed" in haystack:
         return "postponed"
     if "canceled" in haystack or "cancelled" in haystack:
         return "cancelled"
-    if state == "in":
-        return "live"
-    if state == "post":
-        return "finished"
-    if state == "pre":
-        return "scheduled"
-    return "unknown"
+    return ESPN_STATE_MAP.get(state, "unknown")
 
 
 def _sofascore_status(status_obj: dict[str, Any] | None) -> str:
     status_obj = status_obj or {}
-    code = _to_int(status_obj.get("code"))
-    status_type = str(status_obj.get("type") or "").lower()
-    description = str(status_obj.get("description") or "").lower()
-    haystack = f"{status_type} {description}"
+    haystack = f"{status_obj.get('type') or ''} {status_obj.get('description') or ''}".lower()
 
     if "inprogress" in haystack:
         return "live"
@@ -144,24 +324,35 @@ def _sofascore_status(status_obj: dict[str, Any] | None) -> str:
         return "postponed"
     if "cancel" in haystack:
         return "cancelled"
-    if code is not None:
-        if code in {1, 2, 3, 4, 5}:
-            return "scheduled"
-        if code in {6, 7, 8, 9, 10, 31, 32, 33}:
-            return "live"
-        if code in {100, 120}:
-            return "finished"
-    return "unknown"
+    return SOFASCORE_CODE_MAP.get(_to_int(status_obj.get("code")), "unknown")
+
+
+def _extract_goal_next_data(html: str | bytes) -> str | bytes | None:
+    # Plain find() calls bound the script body without a regex scan of the whole page.
+    if isinstance(html, bytes):
+        marker, tag_end, closing_tag = GOAL_NEXT_DATA_MARKER.encode(), b">", b"</script>"
+    else:
+        marker, tag_end, closing_tag = GOAL_NEXT_DATA_MARKER, ">", "</script>"
+    marker_index = html.find(marker)
+    if marker_index < 0:
+        return None
+    start = html.find(tag_end, marker_index) + 1
+    if start == 0:
+        return None
+    end = html.find(closing_tag, start)
+    if end < 0:
+        return None
+    return html[start:end]
 
 
-def parse_goal_live_scores_html(html: str) -> list[dict[str, Any]]:
+def parse_goal_live_scores_html(html: str | bytes) -> list[dict[str, Any]]:
     # Goal embeds structured match data in a Next.js payload script tag.
-    match = GOAL_NEXT_DATA_PATTERN.search(html)
-    if not match:
+    next_data = _extract_goal_next_data(html)
+    if next_data is None:
         raise ProviderError("Goal payload did not include __NEXT_DATA__")
     try:
-        payload = json.loads(match.group(1))
-    except json.JSONDecodeError as exc:
+        payload = _loads_json(next_data)
+    except ValueError as exc:
         raise ProviderError(f"Unable to parse Goal __NEXT_DATA__: {exc}") from exc
 
     page_props = payload.get("props", {}).get("pageProps", {}).get("content", {})
@@ -169,12 +360,13 @@ def parse_goal_live_scores_html(html: str) -> list[dict[str, Any]]:
     rows: list[dict[str, Any]] = []
 
     for competition_block in competitions:
-        competition = (competition_block.get("competition") or {}).get("name")
+        competition = (competition_block.get("competition") or _EMPTY).get("name")
         for match_row in competition_block.get("matches") or []:
-            team_a = match_row.get("teamA") or {}
-            team_b = match_row.get("teamB") or {}
-            score = match_row.get("score") or {}
-            period = match_row.get("period") or {}
+            team_a = match_row.get("teamA") or _EMPTY
+            team_b = match_row.get("teamB") or _EMPTY
+            score = match_row.get("score") or _EMPTY
+            period = match_row.get("period") or _EMPTY
+            raw_status = match_row.get("status")
             rows.append(
                 {
                     "provider": "goal",
@@ -184,14 +376,14 @@ def parse_goal_live_scores_html(html: str) -> list[dict[str, Any]]:
                     "away_team": team_b.get("name") or team_b.get("short"),
                     "home_score": _to_int(score.get("teamA")),
                     "away_score": _to_int(score.get("teamB")),
-                    "status": _goal_status(match_row.get("status")),
-                    "raw_status": match_row.get("status"),
+                    "status": _goal_status(raw_status),
+                    "raw_status": raw_status,
                     "period": period.get("type"),
                     "minute": _to_int(period.get("minute")),
                     "extra_minute": _to_int(period.get("extra")),
                     "start_time_utc": match_row.get("startDate"),
                     "last_updated_utc": match_row.get("lastUpdatedAt") or match_row.get("cachedAt"),
-                    "venue": (match_row.get("venue") or {}).get("name"),
+                    "venue": (match_row.get("venue") or _EMPTY).get("name"),
                     "streamed_watch_url": None,
                     "discrepancies": [],
                 }
@@ -207,11 +399,17 @@ def parse_espn_scoreboard_payload(
     rows: list[dict[str, Any]] = []
 
     for event in events:
-        competition = (event.get("competitions") or [{}])[0]
+        competition = (event.get("competitions") or _EMPTY_ROWS)[0]
         competitors = competition.get("competitors") or []
         # ESPN usually tags home/away explicitly; fallback to first two rows if missing.
-        home = next((c for c in competitors if c.get("homeAway") == "home"), None)
-        away = next((c for c in competitors if c.get("homeAway") == "away"), None)
+        home = None
+        away = None
+        for competitor in competitors:
+            home_away = competitor.get("homeAway")
+            if home_away == "home" and home is None:
+                home = competitor
+            elif home_away == "away" and away is None:
+                away = competitor
         if home is None or away is None:
             if len(competitors) >= 2:
                 home = competitors[0]
@@ -219,31 +417,30 @@ def parse_espn_scoreboard_payload(
             else:
                 continue
 
-        status_obj = competition.get("status") or {}
-        status_type = status_obj.get("type") or {}
-        display_clock = str(status_obj.get("displayClock") or "")
-        minute_match = ESPN_CLOCK_PATTERN.search(display_clock)
-        minute = _to_int(minute_match.group(1)) if minute_match else None
-        extra = _to_int(minute_match.group(2)) if minute_match else None
-        league = (event.get("league") or {}).get("name")
+        status_obj = competition.get("status") or _EMPTY
+        status_type = status_obj.get("type") or _EMPTY
+        status_description = status_type.get("description")
+        minute, extra = _parse_espn_clock(str(status_obj.get("displayClock") or ""))
+        league = (event.get("league") or _EMPTY).get("name")
+        notes = competition.get("notes") or _EMPTY_ROWS
 
         rows.append(
             {
                 "provider": "espn",
                 "provider_match_id": event.get("id"),
-                "competition": league or (competition.get("notes") or [{}])[0].get("headline"),
-                "home_team": (home.get("team") or {}).get("displayName"),
-                "away_team": (away.get("team") or {}).get("displayName"),
+                "competition": league or notes[0].get("headline"),
+                "home_team": (home.get("team") or _EMPTY).get("displayName"),
+                "away_team": (away.get("team") or _EMPTY).get("displayName"),
                 "home_score": _to_int(home.get("score")),
                 "away_score": _to_int(away.get("score")),
                 "status": _espn_status(status_type),
-                "raw_status": status_type.get("name") or status_type.get("description"),
-                "period": status_type.get("description"),
+                "raw_status": status_type.get("name") or status_description,
+                "period": status_description,
                 "minute": minute,
                 "extra_minute": extra,
                 "start_time_utc": competition.get("startDate") or event.get("date"),
                 "last_updated_utc": fetched_at_utc,
-                "venue": (competition.get("venue") or {}).get("fullName"),
+                "venue": (competition.get("venue") or _EMPTY).get("fullName"),
                 "streamed_watch_url": None,
                 "discrepancies": [],
             }
@@ -261,17 +458,20 @@ def parse_sofascore_live_payload(
     for event in events:
         if not isinstance(event, dict):
             continue
-        home_team = (event.get("homeTeam") or {}).get("name")
-        away_team = (event.get("awayTeam") or {}).get("name")
+        home_team = (event.get("homeTeam") or _EMPTY).get("name")
+        away_team = (event.get("awayTeam") or _EMPTY).get("name")
         if not home_team or not away_team:
             continue
 
+        tournament = event.get("tournament") or _EMPTY
         competition = (
-            (((event.get("tournament") or {}).get("uniqueTournament") or {}).get("name"))
-            or ((event.get("tournament") or {}).get("name"))
+            (tournament.get("uniqueTournament") or _EMPTY).get("name")
+            or tournament.get("name")
         )
-        home_score = _to_int((event.get("homeScore") or {}).get("current"))
-        away_score = _to_int((event.get("awayScore") or {}).get("current"))
+        home_score = _to_int((event.get("homeScore") or _EMPTY).get("current"))
+        away_score = _to_int((event.get("awayScore") or _EMPTY).get("current"))
+        status = event.get("status") or _EMPTY
+        status_description = status.get("description")
 
         rows.append(
             {
@@ -282,9 +482,9 @@ def parse_sofascore_live_payload(
                 "away_team": away_team,
                 "home_score": home_score,
                 "away_score": away_score,
-                "status": _sofascore_status(event.get("status") or {}),
-                "raw_status": (event.get("status") or {}).get("description"),
-                "period": (event.get("status") or {}).get("description"),
+                "status": _sofascore_status(status),
+                "raw_status": status_description,
+                "period": status_description,
                 # SofaScore minute formats vary across competitions. Keep period text only.
                 "minute": None,
                 "extra_minute": None,
@@ -302,13 +502,14 @@ def parse_streamed_live_payload(
     payload: list[dict[str, Any]],
     fetched_at_utc: str | None = None,
 ) -> list[dict[str, Any]]:
+    fetch_iso = fetched_at_utc or utc_now_iso()
     rows: list[dict[str, Any]] = []
     for item in payload:
         if str(item.get("category") or "").lower() != "football":
             continue
-        teams = item.get("teams") or {}
-        home_team = (teams.get("home") or {}).get("name")
-        away_team = (teams.get("away") or {}).get("name")
+        teams = item.get("teams") or _EMPTY
+        home_team = (teams.get("home") or _EMPTY).get("name")
+        away_team = (teams.get("away") or _EMPTY).get("name")
         if not home_team or not away_team:
             title = str(item.get("title") or "")
             if " vs " in title:
@@ -333,7 +534,7 @@ def parse_streamed_live_payload(
                 "minute": None,
                 "extra_minute": None,
                 "start_time_utc": epoch_ms_to_iso_utc(_to_int(item.get("date"))),
-                "last_updated_utc": fetched_at_utc or utc_now_iso(),
+                "last_updated_utc": fetch_iso,
                 "venue": None,
                 "streamed_watch_url": (
                     f"https://streamed.pk/watch/{match_id}" if match_id else None
@@ -351,7 +552,7 @@ class GoalProvider:
         self.http_client = http_client or HttpClient.from_env()
 
     def fetch_matches(self) -> list[dict[str, Any]]:
-        html = self.http_client.get_text(GOAL_LIVE_SCORES_URL)
+        html = self.http_client.get_bytes(GOAL_LIVE_SCORES_URL)
         return parse_goal_live_scores_html(html)
 
 
@@ -2,15 +2,29 @@ from __future__ import annotations
 
 import argparse
 import json
+import time
 from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Any
 from urllib.parse import parse_qs, urlparse
 
+try:
+    import orjson
+except ImportError:  # Optional speedup; falls back to the stdlib encoder.
+    orjson = None
+
 from footballapi.service import LiveScoreService
 
+RESPONSE_CACHE_MAX_ENTRIES = 256
+
 
 class LiveScoreRequestHandler(BaseHTTPRequestHandler):
     server_version = "footballapi/0.1"
+    # Keep-alive lets dashboards poll over one connection; idle sockets free their thread.
+    protocol_version = "HTTP/1.1"
+    timeout = 30
     score_service = LiveScoreService()
+    # Rendered live-scores bodies keyed by query filters: (expires_at, encoded JSON).
+    response_cache: dict[tuple[Any, ...], tuple[float, bytes]] = {}
 
     def do_OPTIONS(self) -> None:  # noqa: N802
         self.send_response(204)
@@ -34,6 +48,15 @@ class LiveScoreRequestHandler(BaseHTTPRequestHandler):
             include_stale = include_stale_flag in {"1", "true", "yes", "on"}
             include_conflicts_flag = (query.get("include_conflicts") or ["0"])[0].lower()
             include_conflicts = include_conflicts_flag in {"1", "true", "yes", "on"}
+            limit = _parse_limit((query.get("limit") or [None])[0])
+            cache_key = (status, source, league, include_stale, include_conflicts, limit)
+            if force_refresh:
+                self.response_cache.clear()
+            else:
+                cached = self.response_cache.get(cache_key)
+                if cached is not None and time.time() < cached[0]:
+                    self._write_encoded_json(200, cached[1])
+                    return
             try:
                 payload = self.score_service.get_scores(
                     status=status,
@@ -42,11 +65,18 @@ class LiveScoreRequestHandler(BaseHTTPRequestHandler):
                     include_stale=include_stale,
                     include_conflicts=include_conflicts,
                     force_refresh=force_refresh,
+                    limit=limit,
                 )
             except Exception as exc:
                 self._write_json(500, {"ok": False, "error": str(exc)})
                 return
-            self._write_json(200, payload)
+            encoded = _dumps_json(payload)
+            if len(self.response_cache) >= RESPONSE_CACHE_MAX_ENTRIES:
+                # League filters are free text; cap the key space instead of growing forever.
+                self.response_cache.clear()
+            expires_at = self.score_service.cache_expires_at(payload.get("generated_at_utc"))
+            self.response_cache[cache_key] = (expires_at, encoded)
+            self._write_encoded_json(200, encoded)
             return
         self._write_json(404, {"ok": False, "error": "Not found"})
 
@@ -60,7 +90,9 @@ class LiveScoreRequestHandler(BaseHTTPRequestHandler):
         self.send_header("Access-Control-Allow-Headers", "Content-Type")
 
     def _write_json(self, status_code: int, payload: dict) -> None:
-        encoded = json.dumps(payload, ensure_ascii=True).encode("utf-8")
+        self._write_encoded_json(status_code, _dumps_json(payload))
+
+    def _write_encoded_json(self, status_code: int, encoded: bytes) -> None:
         self.send_response(status_code)
         self._send_cors_headers()
         self.send_header("Content-Type", "application/json; charset=utf-8")
@@ -69,6 +101,29 @@ class LiveScoreRequestHandler(BaseHTTPRequestHandler):
         self.wfile.write(encoded)
 
 
+def _parse_limit(raw: str | None) -> int | None:
+    if not raw:
+        return None
+    try:
+        limit = int(raw)
+    except ValueError:
+        return None
+    # Same semantics as LiveScoreService.get_scores: 0 (or less) returns no matches.
+    return max(0, limit)
+
+
+def _dumps_json(payload: Any) -> bytes:
+    if orjson is not None:
+        # Serializes straight to UTF-8 bytes in a single pass.
+        return orjson.dumps(payload)
+    return json.dumps(payload, ensure_ascii=True).encode("utf-8")
+
+
+class LiveScoreHTTPServer(ThreadingHTTPServer):
+    # Absorb bursts of pollers arriving together at a cache expiry.
+    request_queue_size = 128
+
+
 def build_arg_parser() -> argparse.ArgumentParser:
     parser = argparse.ArgumentParser(description="Serve live football scores over HTTP.")
     parser.add_argument("--host", default="0.0.0.0")
@@ -80,7 +135,8 @@ def build_arg_parser() -> argparse.ArgumentParser:
 def main() -> None:
     args = build_arg_parser().parse_args()
     LiveScoreRequestHandler.score_service = LiveScoreService(cache_seconds=args.cache_seconds)
-    server = ThreadingHTTPServer((args.host, args.port), LiveScoreRequestHandler)
+    LiveScoreRequestHandler.response_cache = {}
+    server = LiveScoreHTTPServer((args.host, args.port), LiveScoreRequestHandler)
     print(f"footballapi listening on http://{args.host}:{args.port}")
     server.serve_forever()
 
@@ -1,17 +1,20 @@
 from __future__ import annotations
 
-import copy
-from concurrent.futures import ThreadPoolExecutor, as_completed
+import atexit
+from collections import defaultdict
+from collections.abc import Sequence
+from concurrent.futures import Future, ThreadPoolExecutor, as_completed
 from dataclasses import dataclass
 import os
 from typing import Any
 import threading
 import time
+from types import MappingProxyType
 
 from footballapi.normalize import (
-    minutes_between,
+    normalize_team_name,
+    normalized_team_pair_similarity,
     parse_iso_utc,
-    team_pair_similarity,
     utc_now_iso,
 )
 from footballapi.providers import EspnProvider, GoalProvider, SofaScoreProvider, StreamedProvider
@@ -26,6 +29,19 @@ STATUS_PRIORITY = {
 }
 
 
+# Precomputed _preferred_status answers for every pair of known statuses.
+STATUS_PAIR_WINNER = {
+    (first, second): second if STATUS_PRIORITY[second] > STATUS_PRIORITY[first] else first
+    for first in STATUS_PRIORITY
+    for second in STATUS_PRIORITY
+}
+
+# Provider rows are normalized on arrival so these are always str ("" when unknown).
+ROW_TEXT_KEYS = ("home_team", "away_team", "competition", "status")
+
+ROW_LOOKUP_KEYS = ("_status_lc", "_sources_lc", "_competition_lc", "_last_updated_dt")
+
+
 @dataclass(frozen=True)
 class MatchLink:
     base_index: int
@@ -44,18 +60,60 @@ def _env_int(name: str, default: int) -> int:
         return default
 
 
+def _fetch_provider_rows(provider: Any) -> list[dict[str, Any]]:
+    # Runs in the fetch worker, so row normalization overlaps with the other providers.
+    rows = provider.fetch_matches()
+    if not isinstance(rows, list):
+        return []
+    for row in rows:
+        _normalize_row(row)
+    return rows
+
+
+def _normalize_row(row: dict[str, Any]) -> None:
+    # Every provider's rows pass through here, built-in or not, so the refresh path can
+    # index the text fields directly instead of re-coercing them per access.
+    for key in ROW_TEXT_KEYS:
+        value = row.get(key)
+        if value is None:
+            row[key] = ""
+        elif not isinstance(value, str):
+            row[key] = str(value)
+
+
+def _add_lookup_keys(row: dict[str, Any]) -> None:
+    # Filter/quality inputs are pure functions of a merged row; derive them once per
+    # refresh. The underscore keys stay internal to the cache and are dropped by _clone_row.
+    # Merged rows are built from normalized provider rows, so the text fields are str.
+    row["_status_lc"] = row["status"].lower()
+    row["_sources_lc"] = frozenset(src.lower() for src in row.get("sources", []))
+    row["_competition_lc"] = row["competition"].lower()
+    row["_last_updated_dt"] = parse_iso_utc(row.get("last_updated_utc"))
+
+
+def _clone_row(row: dict[str, Any]) -> dict[str, Any]:
+    # Rows hold primitives plus a few small containers; copying just those is far
+    # cheaper than deepcopy's generic memoized traversal.
+    clone = dict(row)
+    for key in ROW_LOOKUP_KEYS:
+        clone.pop(key, None)
+    clone["discrepancies"] = list(row.get("discrepancies") or [])
+    if "sources" in row:
+        clone["sources"] = list(row["sources"])
+    if "external_ids" in row:
+        clone["external_ids"] = dict(row["external_ids"])
+    return clone
+
+
 def _preferred_status(first: str, second: str) -> str:
-    first_priority = STATUS_PRIORITY.get(first, 0)
-    second_priority = STATUS_PRIORITY.get(second, 0)
-    if second_priority > first_priority:
+    winner = STATUS_PAIR_WINNER.get((first, second))
+    if winner is not None:
+        return winner
+    if STATUS_PRIORITY.get(second, 0) > STATUS_PRIORITY.get(first, 0):
         return second
     return first
 
 
-def _score_pair(row: dict[str, Any]) -> tuple[int | None, int | None]:
-    return row.get("home_score"), row.get("away_score")
-
-
 def _max_timestamp(left: str | None, right: str | None) -> str | None:
     left_dt = parse_iso_utc(left)
     right_dt = parse_iso_utc(right)
@@ -66,6 +124,19 @@ def _max_timestamp(left: str | None, right: str | None) -> str | None:
     return left if left_dt >= right_dt else right
 
 
+def _team_key(row: dict[str, Any]) -> tuple[str, str]:
+    return (
+        normalize_team_name(str(row.get("home_team") or "")),
+        normalize_team_name(str(row.get("away_team") or "")),
+    )
+
+
+def _kickoff_epoch(row: dict[str, Any]) -> float | None:
+    # Plain floats keep the per-pair kickoff gap to one subtraction, no timedelta objects.
+    start = parse_iso_utc(row.get("start_time_utc"))
+    return start.timestamp() if start is not None else None
+
+
 def _match_records(
     base_rows: list[dict[str, Any]],
     candidate_rows: list[dict[str, Any]],
@@ -74,41 +145,79 @@ def _match_records(
 ) -> list[MatchLink]:
     # Greedy one-to-one linking by team-name similarity plus kickoff proximity.
     links: list[MatchLink] = []
-    used_candidates: set[int] = set()
-
-    for base_index, base in enumerate(base_rows):
-        best: MatchLink | None = None
-        for candidate_index, candidate in enumerate(candidate_rows):
-            if candidate_index in used_candidates:
-                continue
-            minute_gap = minutes_between(
-                base.get("start_time_utc"),
-                candidate.get("start_time_utc"),
-            )
-            if minute_gap is not None and minute_gap > max_minutes_diff:
+    # Normalized names and kickoffs are loop-invariant per row; resolve them once, not per pair.
+    base_keys = [_team_key(row) for row in base_rows]
+    candidate_keys = [_team_key(row) for row in candidate_rows]
+    base_starts = [_kickoff_epoch(row) for row in base_rows]
+    candidate_starts = [_kickoff_epoch(row) for row in candidate_rows]
+    max_gap_seconds = max_minutes_diff * 60.0
+    linked = [False] * len(candidate_rows)
+    unlinked_count = len(candidate_rows)
+
+    # Token blocking: only score candidates sharing a normalized name token with the base.
+    blocks: dict[str, list[int]] = defaultdict(list)
+    for candidate_index, (candidate_home, candidate_away) in enumerate(candidate_keys):
+        for token in {*candidate_home.split(), *candidate_away.split()}:
+            blocks[token].append(candidate_index)
+
+    for base_index, (base_home, base_away) in enumerate(base_keys):
+        if not unlinked_count:
+            break
+        shortlist = {
+            candidate_index
+            for token in {*base_home.split(), *base_away.split()}
+            for candidate_index in blocks.get(token, ())
+            if not linked[candidate_index]
+        }
+        if shortlist:
+            # Sorted so ties still resolve to the earliest candidate, as in a full scan.
+            candidate_indices = sorted(shortlist)
+        else:
+            candidate_indices = [index for index, used in enumerate(linked) if not used]
+
+        base_start = base_starts[base_index]
+        # Best-so-far as plain locals; the MatchLink is only built for the winner.
+        best_similarity = -1.0
+        best_candidate = -1
+        best_swapped = False
+        for candidate_index in candidate_indices:
+            candidate_home, candidate_away = candidate_keys[candidate_index]
+            candidate_start = candidate_starts[candidate_index]
+            time_bonus = 0.0
+            if base_start is not None and candidate_start is not None:
+                gap_seconds = abs(base_start - candidate_start)
+                if gap_seconds > max_gap_seconds:
+                    continue
+                # Favor matches with close start times to reduce false joins.
+                time_bonus = max(0.0, 1.0 - (gap_seconds / max_gap_seconds)) * 0.10
+            if 1.0 + time_bonus <= best_similarity:
+                # Name similarity is capped at 1.0, so this candidate cannot win.
                 continue
 
-            similarity, swapped = team_pair_similarity(
-                str(base.get("home_team") or ""),
-                str(base.get("away_team") or ""),
-                str(candidate.get("home_team") or ""),
-                str(candidate.get("away_team") or ""),
+            similarity, swapped = normalized_team_pair_similarity(
+                base_home,
+                base_away,
+                candidate_home,
+                candidate_away,
             )
-            if minute_gap is not None:
-                # Favor matches with close start times to reduce false joins.
-                similarity += max(0.0, 1.0 - (minute_gap / max_minutes_diff)) * 0.10
-            if best is None or similarity > best.similarity:
-                best = MatchLink(
-                    base_index=base_index,
-                    candidate_index=candidate_index,
-                    similarity=similarity,
-                    swapped=swapped,
-                )
+            similarity += time_bonus
+            if similarity > best_similarity:
+                best_similarity = similarity
+                best_candidate = candidate_index
+                best_swapped = swapped
 
-        if best is None or best.similarity < min_similarity:
+        if best_candidate < 0 or best_similarity < min_similarity:
             continue
-        used_candidates.add(best.candidate_index)
-        links.append(best)
+        linked[best_candidate] = True
+        unlinked_count -= 1
+        links.append(
+            MatchLink(
+                base_index=base_index,
+                candidate_index=best_candidate,
+                similarity=best_similarity,
+                swapped=best_swapped,
+            )
+        )
     return links
 
 
@@ -122,7 +231,7 @@ def merge_provider_matches(
     merged: list[dict[str, Any]] = []
     # Start with Goal as the base feed, then enrich/verify with other sources.
     for row in goal_rows:
-        merged_row = copy.deepcopy(row)
+        merged_row = _clone_row(row)
         merged_row["sources"] = ["goal"]
         merged_row["confidence"] = 0.72
         merged_row["verification"] = "single_source"
@@ -148,25 +257,27 @@ def merge_provider_matches(
             espn_row.get("last_updated_utc"),
         )
 
-        goal_scores = _score_pair(goal_row)
-        espn_scores = _score_pair(espn_row)
-        # Strongest signal is exact score agreement across sources.
-        if goal_scores == espn_scores and None not in goal_scores:
-            goal_row["verification"] = "confirmed_by_multiple_sources"
-            goal_row["confidence"] = max(goal_row["confidence"], 0.95)
-        elif None not in goal_scores and None not in espn_scores and goal_scores != espn_scores:
-            goal_row["verification"] = "score_conflict"
-            goal_row["confidence"] = min(goal_row["confidence"], 0.56)
-            goal_row["discrepancies"].append(
-                (
-                    "Goal score "
-                    f"{goal_scores[0]}-{goal_scores[1]} differs from ESPN "
-                    f"{espn_scores[0]}-{espn_scores[1]}"
+        goal_home, goal_away = goal_row.get("home_score"), goal_row.get("away_score")
+        espn_home, espn_away = espn_row.get("home_score"), espn_row.get("away_score")
+        espn_complete = espn_home is not None and espn_away is not None
+        if goal_home is not None and goal_away is not None and espn_complete:
+            # Strongest signal is exact score agreement across sources.
+            if goal_home == espn_home and goal_away == espn_away:
+                goal_row["verification"] = "confirmed_by_multiple_sources"
+                goal_row["confidence"] = max(goal_row["confidence"], 0.95)
+            else:
+                goal_row["verification"] = "score_conflict"
+                goal_row["confidence"] = min(goal_row["confidence"], 0.56)
+                goal_row["discrepancies"].append(
+                    (
+                        "Goal score "
+                        f"{goal_home}-{goal_away} differs from ESPN "
+                        f"{espn_home}-{espn_away}"
+                    )
                 )
-            )
-        elif None in goal_scores and None not in espn_scores:
-            goal_row["home_score"] = espn_row.get("home_score")
-            goal_row["away_score"] = espn_row.get("away_score")
+        elif espn_complete:
+            goal_row["home_score"] = espn_home
+            goal_row["away_score"] = espn_away
             goal_row["verification"] = "filled_from_espn"
             goal_row["confidence"] = max(goal_row["confidence"], 0.83)
 
@@ -179,7 +290,7 @@ def merge_provider_matches(
         if index in linked_espn:
             continue
         # Keep unmatched ESPN rows so coverage is not lost when Goal misses a fixture.
-        row = copy.deepcopy(espn_row)
+        row = _clone_row(espn_row)
         row["sources"] = ["espn"]
         row["confidence"] = 0.68
         row["verification"] = "single_source"
@@ -205,26 +316,28 @@ def merge_provider_matches(
             sofa_row.get("last_updated_utc"),
         )
 
-        merged_scores = _score_pair(merged_row)
-        sofa_scores = _score_pair(sofa_row)
-        if merged_scores == sofa_scores and None not in merged_scores:
-            merged_row["verification"] = "confirmed_by_multiple_sources"
-            merged_row["confidence"] = max(merged_row["confidence"], 0.96)
-        elif None in merged_scores and None not in sofa_scores:
-            merged_row["home_score"] = sofa_row.get("home_score")
-            merged_row["away_score"] = sofa_row.get("away_score")
+        merged_home, merged_away = merged_row.get("home_score"), merged_row.get("away_score")
+        sofa_home, sofa_away = sofa_row.get("home_score"), sofa_row.get("away_score")
+        sofa_complete = sofa_home is not None and sofa_away is not None
+        if merged_home is not None and merged_away is not None and sofa_complete:
+            if merged_home == sofa_home and merged_away == sofa_away:
+                merged_row["verification"] = "confirmed_by_multiple_sources"
+                merged_row["confidence"] = max(merged_row["confidence"], 0.96)
+            else:
+                merged_row["verification"] = "score_conflict"
+                merged_row["confidence"] = min(merged_row["confidence"], 0.50)
+                merged_row["discrepancies"].append(
+                    (
+                        "Merged score "
+                        f"{merged_home}-{merged_away} differs from SofaScore "
+                        f"{sofa_home}-{sofa_away}"
+                    )
+                )
+        elif sofa_complete:
+            merged_row["home_score"] = sofa_home
+            merged_row["away_score"] = sofa_away
             merged_row["verification"] = "filled_from_sofascore"
             merged_row["confidence"] = max(merged_row["confidence"], 0.86)
-        elif None not in merged_scores and None not in sofa_scores and merged_scores != sofa_scores:
-            merged_row["verification"] = "score_conflict"
-            merged_row["confidence"] = min(merged_row["confidence"], 0.50)
-            merged_row["discrepancies"].append(
-                (
-                    "Merged score "
-                    f"{merged_scores[0]}-{merged_scores[1]} differs from SofaScore "
-                    f"{sofa_scores[0]}-{sofa_scores[1]}"
-                )
-            )
 
         if not merged_row.get("competition") and sofa_row.get("competition"):
             merged_row["competition"] = sofa_row.get("competition")
@@ -233,7 +346,7 @@ def merge_provider_matches(
         if index in linked_sofa:
             continue
         # Keep unmatched SofaScore rows to preserve broad live-market visibility.
-        row = copy.deepcopy(sofa_row)
+        row = _clone_row(sofa_row)
         row["sources"] = ["sofascore"]
         row["confidence"] = 0.74
         row["verification"] = "single_source"
@@ -280,9 +393,30 @@ class LiveScoreService:
             SofaScoreProvider(),
             StreamedProvider(),
         ]
+        # Providers are independent and I/O-bound; keep one worker per provider alive
+        # between refreshes instead of spinning up threads on every cache miss.
+        self._executor = ThreadPoolExecutor(
+            max_workers=max(1, len(self.providers)),
+            thread_name_prefix="footballapi-fetch",
+        )
+        atexit.register(self._executor.shutdown)
         self._lock = threading.Lock()
         self._cache_payload: dict[str, Any] | None = None
         self._cache_expires_at = 0.0
+        self._refresh_future: Future[dict[str, Any]] | None = None
+
+    def close(self) -> None:
+        # Stop the fetch workers; the service must not be used afterwards.
+        atexit.unregister(self._executor.shutdown)
+        self._executor.shutdown()
+
+    def cache_expires_at(self, generated_at_utc: str | None) -> float:
+        # Epoch expiry of the cached payload built at generated_at_utc; 0.0 once replaced.
+        with self._lock:
+            payload = self._cache_payload
+            if payload is None or payload.get("generated_at_utc") != generated_at_utc:
+                return 0.0
+            return self._cache_expires_at
 
     def get_scores(
         self,
@@ -292,6 +426,7 @@ class LiveScoreService:
         include_stale: bool = False,
         include_conflicts: bool = False,
         force_refresh: bool = False,
+        limit: int | None = None,
     ) -> dict[str, Any]:
         payload = self._refresh_if_needed(force_refresh=force_refresh)
         matches = payload.get("matches") or []
@@ -301,26 +436,35 @@ class LiveScoreService:
             generated_at_utc=payload.get("generated_at_utc"),
             include_stale=include_stale,
             include_conflicts=include_conflicts,
+            limit=None if limit is None else max(0, limit),
         )
 
-        result = copy.deepcopy(payload)
-        result["matches"] = filtered
-        result["count"] = len(filtered)
-        result["quality"] = {
-            "max_live_stale_seconds": self.max_live_stale_seconds,
-            "include_stale": include_stale,
-            "include_conflicts": include_conflicts,
-            "dropped_stale_count": dropped_stale,
-            "dropped_conflict_count": dropped_conflicts,
-        }
-        result["filters"] = {
-            "status": status,
-            "source": source,
-            "league": league,
+        # Rows in `filtered` are fresh clones from the quality gate; the rest is rebuilt
+        # here so callers never hold references into the shared cached payload.
+        return {
+            "generated_at_utc": payload.get("generated_at_utc"),
+            "matches": filtered,
+            "count": len(filtered),
+            "providers": {
+                name: dict(info) for name, info in (payload.get("providers") or {}).items()
+            },
+            "quality": {
+                "max_live_stale_seconds": self.max_live_stale_seconds,
+                "include_stale": include_stale,
+                "include_conflicts": include_conflicts,
+                "dropped_stale_count": dropped_stale,
+                "dropped_conflict_count": dropped_conflicts,
+            },
+            "filters": {
+                "status": status,
+                "source": source,
+                "league": league,
+                "limit": limit,
+            },
         }
-        return result
 
     def _refresh_if_needed(self, force_refresh: bool) -> dict[str, Any]:
+        # The cached payload is shared and must be treated as read-only by callers.
         now = time.time()
         with self._lock:
             if (
@@ -328,89 +472,115 @@ class LiveScoreService:
                 and self._cache_payload is not None
                 and now < self._cache_expires_at
             ):
-                return copy.deepcopy(self._cache_payload)
+                return self._cache_payload
+            # Coalesce concurrent misses behind one in-flight refresh; a forced refresh
+            # always starts its own so it never returns data fetched before it was asked.
+            refresh_future = self._refresh_future
+            if refresh_future is None or force_refresh:
+                refresh_future = Future()
+                self._refresh_future = refresh_future
+                leader = True
+            else:
+                leader = False
+
+        if not leader:
+            return refresh_future.result()
+
+        # The leader fetches on its own thread: the executor is sized for the providers,
+        # so parking the refresh there as well could starve the fetches it waits on.
+        try:
+            payload = self._build_payload()
+        except BaseException as exc:
+            with self._lock:
+                if self._refresh_future is refresh_future:
+                    self._refresh_future = None
+            refresh_future.set_exception(exc)
+            raise
 
+        with self._lock:
+            # A forced refresh that replaced this one owns the cache; never overwrite its
+            # newer payload with data fetched earlier.
+            if self._refresh_future is refresh_future:
+                self._cache_payload = payload
+                self._cache_expires_at = time.time() + self.cache_seconds
+                self._refresh_future = None
+        refresh_future.set_result(payload)
+        return payload
+
+    def _build_payload(self) -> dict[str, Any]:
         provider_rows: dict[str, list[dict[str, Any]]] = {}
         provider_errors: dict[str, str] = {}
 
         # Pull providers in parallel to reduce end-to-end API latency.
-        with ThreadPoolExecutor(max_workers=max(1, len(self.providers))) as executor:
-            future_map = {executor.submit(p.fetch_matches): p for p in self.providers}
-            for future in as_completed(future_map):
-                provider = future_map[future]
-                provider_name = getattr(provider, "name", provider.__class__.__name__.lower())
-                try:
-                    data = future.result()
-                except Exception as exc:
-                    provider_rows[provider_name] = []
-                    provider_errors[provider_name] = str(exc)
-                    continue
-                provider_rows[provider_name] = data if isinstance(data, list) else []
+        future_map = {self._executor.submit(_fetch_provider_rows, p): p for p in self.providers}
+        for future in as_completed(future_map):
+            provider = future_map[future]
+            provider_name = getattr(provider, "name", provider.__class__.__name__.lower())
+            try:
+                data = future.result()
+            except Exception as exc:
+                provider_rows[provider_name] = []
+                provider_errors[provider_name] = str(exc)
+                continue
+            provider_rows[provider_name] = data
 
         goal_rows = provider_rows.get("goal", [])
         espn_rows = provider_rows.get("espn", [])
         sofa_rows = provider_rows.get("sofascore", [])
         streamed_rows = provider_rows.get("streamed", [])
         merged_rows = merge_provider_matches(goal_rows, espn_rows, streamed_rows, sofa_rows)
+        for row in merged_rows:
+            _add_lookup_keys(row)
 
         payload: dict[str, Any] = {
             "generated_at_utc": utc_now_iso(),
-            "matches": merged_rows,
+            "matches": tuple(merged_rows),
             "count": len(merged_rows),
-            "providers": {
-                provider: {
-                    "ok": provider not in provider_errors,
-                    "count": len(provider_rows.get(provider, [])),
-                    "error": provider_errors.get(provider),
+            # Read-only views: every caller shares this payload until the next refresh.
+            "providers": MappingProxyType(
+                {
+                    provider: MappingProxyType(
+                        {
+                            "ok": provider not in provider_errors,
+                            "count": len(provider_rows.get(provider, [])),
+                            "error": provider_errors.get(provider),
+                        }
+                    )
+                    for provider in sorted(set(provider_rows.keys()) | set(provider_errors.keys()))
                 }
-                for provider in sorted(set(provider_rows.keys()) | set(provider_errors.keys()))
-            },
+            ),
         }
 
-        with self._lock:
-            self._cache_payload = payload
-            self._cache_expires_at = time.time() + self.cache_seconds
-            return copy.deepcopy(payload)
+        return payload
 
     @staticmethod
     def _filter_matches(
-        matches: list[dict[str, Any]],
+        matches: Sequence[dict[str, Any]],
         status: str,
         source: str,
         league: str | None,
     ) -> list[dict[str, Any]]:
-        filtered = list(matches)
-
+        # Normalize the caller's filters once; None means "no constraint".
+        wanted_statuses: frozenset[str] | None = None
         normalized_status = (status or "all").strip().lower()
         if normalized_status and normalized_status not in {"all", "*"}:
-            wanted_statuses = {
-                entry.strip().lower()
-                for entry in normalized_status.split(",")
-                if entry.strip()
-            }
-            filtered = [
-                row
-                for row in filtered
-                if str(row.get("status") or "").lower() in wanted_statuses
-            ]
-
-        normalized_source = (source or "all").strip().lower()
-        if normalized_source and normalized_source not in {"all", "*"}:
-            filtered = [
-                row
-                for row in filtered
-                if normalized_source in {src.lower() for src in row.get("sources", [])}
-            ]
-
-        if league:
-            needle = league.strip().lower()
-            if needle:
-                filtered = [
-                    row
-                    for row in filtered
-                    if needle in str(row.get("competition") or "").lower()
-                ]
-        return filtered
+            wanted_statuses = frozenset(
+                entry.strip() for entry in normalized_status.split(",") if entry.strip()
+            )
+
+        wanted_source: str | None = (source or "all").strip().lower()
+        if not wanted_source or wanted_source in {"all", "*"}:
+            wanted_source = None
+
+        league_needle = (league or "").strip().lower() or None
+
+        return [
+            row
+            for row in matches
+            if (wanted_statuses is None or row["_status_lc"] in wanted_statuses)
+            and (wanted_source is None or wanted_source in row["_sources_lc"])
+            and (league_needle is None or league_needle in row["_competition_lc"])
+        ]
 
     def _apply_quality_gate(
         self,
@@ -418,41 +588,45 @@ class LiveScoreService:
         generated_at_utc: str | None,
         include_stale: bool,
         include_conflicts: bool,
+        limit: int | None = None,
     ) -> tuple[list[dict[str, Any]], int, int]:
         # Quality gate drops stale live rows and score conflicts by default.
+        # Rows arrive in display order, so only the first `limit` survivors are cloned.
         reference_time = parse_iso_utc(generated_at_utc) or parse_iso_utc(utc_now_iso())
         if reference_time is None:
-            return list(matches), 0, 0
+            return [_clone_row(row) for row in matches[:limit]], 0, 0
 
         kept: list[dict[str, Any]] = []
         dropped_stale = 0
         dropped_conflicts = 0
+        max_stale_seconds = float(self.max_live_stale_seconds)
+        stale_reason = f"older_than_{self.max_live_stale_seconds}_seconds"
         for row in matches:
-            candidate = copy.deepcopy(row)
-            last_updated = parse_iso_utc(candidate.get("last_updated_utc"))
+            # Decide drops from the shared row so rejected rows are never cloned.
+            if row.get("verification") == "score_conflict" and not include_conflicts:
+                dropped_conflicts += 1
+                continue
+            last_updated = row["_last_updated_dt"]
             age_seconds: float | None = None
             if last_updated is not None:
                 age_seconds = max(0.0, (reference_time - last_updated).total_seconds())
-            candidate["last_update_age_seconds"] = age_seconds
-
-            status = str(candidate.get("status") or "unknown").lower()
-            is_stale = status == "live" and (
-                age_seconds is None or age_seconds > float(self.max_live_stale_seconds)
+            is_stale = row["_status_lc"] == "live" and (
+                age_seconds is None or age_seconds > max_stale_seconds
             )
+            if is_stale and not include_stale:
+                dropped_stale += 1
+                continue
+            if limit is not None and len(kept) >= limit:
+                # Past the top N: keep scanning only so the drop counters stay exact.
+                continue
+
+            candidate = _clone_row(row)
+            candidate["last_update_age_seconds"] = age_seconds
             candidate["is_stale"] = is_stale
             if is_stale:
                 candidate["staleness_reason"] = (
-                    "missing_last_update"
-                    if age_seconds is None
-                    else f"older_than_{self.max_live_stale_seconds}_seconds"
+                    "missing_last_update" if age_seconds is None else stale_reason
                 )
-
-            if candidate.get("verification") == "score_conflict" and not include_conflicts:
-                dropped_conflicts += 1
-                continue
-            if is_stale and not include_stale:
-                dropped_stale += 1
-                continue
             kept.append(candidate)
 
         return kept, dropped_stale, dropped_conflicts
@@ -0,0 +1,50 @@
+from __future__ import annotations
+
+from datetime import datetime, timezone
+
+from footballapi.normalize import (
+    epoch_ms_to_iso_utc,
+    epoch_seconds_to_iso_utc,
+    normalize_team_name,
+    parse_iso_utc,
+    similarity,
+    team_pair_similarity,
+)
+
+
+def test_normalize_team_name_drops_stop_words_and_accents() -> None:
+    assert normalize_team_name("1. FC Köln") == "1 koln"
+    assert normalize_team_name("Atlético Madrid") == "madrid"
+    assert normalize_team_name(None) == ""
+
+
+def test_similarity_uses_token_overlap_and_falls_back_for_spelling_variants() -> None:
+    assert similarity("Alpha FC", "alpha") == 1.0
+    assert similarity("Alpha FC", "Omega United") == 0.0
+    assert similarity("Olympiakos", "Olympiacos") > 0.85
+    assert similarity("Inter", "Inter Milan") > 0.6
+    assert similarity("PSG", "Paris Saint Germain") == 0.0
+
+
+def test_team_pair_similarity_detects_swapped_sides() -> None:
+    score, swapped = team_pair_similarity("Alpha FC", "Beta FC", "Beta", "Alpha")
+    assert score == 1.0
+    assert swapped is True
+
+
+def test_parse_iso_utc_normalizes_offsets_to_utc() -> None:
+    expected = datetime(2026, 2, 11, 16, 0, tzinfo=timezone.utc)
+    assert parse_iso_utc("2026-02-11T16:00Z") == expected
+    assert parse_iso_utc(" 2026-02-11T16:00:00.000Z ") == expected
+    assert parse_iso_utc("2026-02-11T18:00:00+02:00") == expected
+    assert parse_iso_utc("2026-02-11T16:00:00").tzinfo is timezone.utc
+    assert parse_iso_utc("not-a-date") is None
+    assert parse_iso_utc(None) is None
+
+
+def test_epoch_formatters_match_isoformat_output() -> None:
+    assert epoch_seconds_to_iso_utc(1770829200) == "2026-02-11T17:00:00Z"
+    assert epoch_ms_to_iso_utc(1770822000000) == "2026-02-11T15:00:00Z"
+    assert epoch_ms_to_iso_utc(1770822000123) == "2026-02-11T15:00:00.123000Z"
+    assert epoch_seconds_to_iso_utc(None) is None
+    assert epoch_seconds_to_iso_utc("bad") is None  # type: ignore[arg-type]
@@ -0,0 +1,64 @@
+from __future__ import annotations
+
+from http.client import HTTPConnection
+import json
+import threading
+
+from footballapi.server import LiveScoreHTTPServer, LiveScoreRequestHandler, _parse_limit
+from footballapi.service import LiveScoreService
+
+
+class CountingProvider:
+    def __init__(self, name: str):
+        self.name = name
+        self.calls = 0
+
+    def fetch_matches(self) -> list[dict]:
+        self.calls += 1
+        return []
+
+
+def test_live_scores_reuses_rendered_response_within_cache_window(monkeypatch) -> None:
+    goal = CountingProvider("goal")
+    service = LiveScoreService(cache_seconds=60, providers=[goal])
+    monkeypatch.setattr(LiveScoreRequestHandler, "score_service", service)
+    monkeypatch.setattr(LiveScoreRequestHandler, "response_cache", {})
+    get_scores_calls: list[dict] = []
+    original_get_scores = service.get_scores
+
+    def counting_get_scores(**kwargs):
+        get_scores_calls.append(kwargs)
+        return original_get_scores(**kwargs)
+
+    monkeypatch.setattr(service, "get_scores", counting_get_scores)
+
+    server = LiveScoreHTTPServer(("127.0.0.1", 0), LiveScoreRequestHandler)
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    try:
+        connection = HTTPConnection("127.0.0.1", server.server_address[1], timeout=5)
+        bodies = []
+        for path in ("/api/live-scores", "/api/live-scores", "/api/live-scores?status=all"):
+            connection.request("GET", path)
+            response = connection.getresponse()
+            assert response.status == 200
+            bodies.append(json.loads(response.read()))
+        connection.close()
+    finally:
+        server.shutdown()
+        server.server_close()
+
+    assert bodies[0] == bodies[1]
+    assert bodies[2]["filters"]["status"] == "all"
+    # The repeated query is answered from the rendered bytes without touching the service.
+    assert len(get_scores_calls) == 2
+    assert goal.calls == 1
+
+
+def test_parse_limit_matches_service_semantics() -> None:
+    assert _parse_limit(None) is None
+    assert _parse_limit("") is None
+    assert _parse_limit("ten") is None
+    assert _parse_limit("5") == 5
+    assert _parse_limit("0") == 0
+    assert _parse_limit("-3") == 0
@@ -1,9 +1,14 @@
 from __future__ import annotations
 
 import copy
+import json
 from datetime import datetime, timedelta, timezone
+import threading
+import time
 
-from footballapi.service import LiveScoreService, merge_provider_matches
+import pytest
+
+from footballapi.service import LiveScoreService, _match_records, merge_provider_matches
 
 
 class StaticProvider:
@@ -103,6 +108,21 @@ def test_merge_provider_matches_marks_conflict_when_scores_differ() -> None:
     assert row["discrepancies"]
 
 
+def test_merge_provider_matches_links_abbreviated_team_names() -> None:
+    goal = {**_goal_row(1, 0), "home_team": "Man Utd", "away_team": "Liverpool"}
+    espn = {**_espn_row(1, 0), "home_team": "Manchester United", "away_team": "Liverpool"}
+    espn["start_time_utc"] = goal["start_time_utc"]
+    rows = merge_provider_matches([goal], [espn], [])
+    assert len(rows) == 1
+    assert rows[0]["verification"] == "confirmed_by_multiple_sources"
+
+
+def test_merge_provider_matches_returns_plain_rows() -> None:
+    rows = merge_provider_matches([_goal_row(2, 1)], [_espn_row(2, 1)], [_streamed_row()])
+    assert not [key for key in rows[0] if key.startswith("_")]
+    json.dumps(rows)
+
+
 def test_live_score_service_applies_filters() -> None:
     goal_rows = [
         _goal_row(2, 1),
@@ -128,6 +148,7 @@ def test_live_score_service_applies_filters() -> None:
     live_payload = service.get_scores(status="live")
     assert live_payload["count"] == 1
     assert live_payload["matches"][0]["home_team"] == "Alpha FC"
+    assert not [key for key in live_payload["matches"][0] if key.startswith("_")]
 
     finished_payload = service.get_scores(status="finished")
     assert finished_payload["count"] == 1
@@ -136,6 +157,10 @@ def test_live_score_service_applies_filters() -> None:
     goal_only_payload = service.get_scores(status="all", source="goal")
     assert goal_only_payload["count"] == 2
 
+    limited_payload = service.get_scores(status="all", limit=1)
+    assert limited_payload["count"] == 1
+    assert limited_payload["matches"][0]["home_team"] == "Alpha FC"
+
 
 def test_live_score_service_drops_stale_live_rows_by_default() -> None:
     stale_time = (
@@ -157,3 +182,162 @@ def test_live_score_service_drops_stale_live_rows_by_default() -> None:
     payload = service.get_scores(status="live")
     assert payload["count"] == 0
     assert payload["quality"]["dropped_stale_count"] == 1
+
+
+def test_live_score_service_limit_keeps_drop_counts_exact() -> None:
+    stale_time = (
+        datetime.now(timezone.utc) - timedelta(minutes=20)
+    ).isoformat().replace("+00:00", "Z")
+    first = _goal_row(1, 0)
+    second = {**_goal_row(0, 0), "home_team": "Gamma FC", "away_team": "Delta FC"}
+    stale = {**_goal_row(2, 2), "home_team": "Omega FC", "away_team": "Sigma FC"}
+    stale["last_updated_utc"] = stale_time
+    for row in (second, stale):
+        row["start_time_utc"] = first["start_time_utc"]
+
+    service = LiveScoreService(
+        cache_seconds=60,
+        max_live_stale_seconds=60,
+        providers=[StaticProvider("goal", [first, second, stale])],
+    )
+    payload = service.get_scores(status="live", limit=1)
+    assert [row["home_team"] for row in payload["matches"]] == ["Alpha FC"]
+    assert payload["quality"]["dropped_stale_count"] == 1
+
+    payload = service.get_scores(status="live", limit=0)
+    assert payload["count"] == 0
+    assert payload["quality"]["dropped_stale_count"] == 1
+
+
+def test_live_score_service_cached_payload_is_isolated_from_callers() -> None:
+    service = LiveScoreService(
+        cache_seconds=60,
+        providers=[
+            StaticProvider("goal", [_goal_row(2, 1)]),
+            StaticProvider("espn", [_espn_row(1, 1)]),
+            StaticProvider("sofascore", []),
+            StaticProvider("streamed", []),
+        ],
+    )
+    first = service.get_scores(status="all", include_conflicts=True)
+    row = first["matches"][0]
+    row["sources"].append("tampered")
+    row["discrepancies"].clear()
+    row["external_ids"]["goal"] = "tampered"
+    first["providers"]["goal"]["count"] = 99
+
+    second = service.get_scores(status="all", include_conflicts=True)
+    row = second["matches"][0]
+    assert row["sources"] == ["goal", "espn"]
+    assert row["discrepancies"]
+    assert row["external_ids"]["goal"] == "goal-1"
+    assert second["providers"]["goal"]["count"] == 1
+
+    cached = service._refresh_if_needed(force_refresh=False)
+    with pytest.raises(TypeError):
+        cached["providers"]["goal"]["count"] = 99  # type: ignore[index]
+
+
+def test_match_records_links_each_candidate_at_most_once() -> None:
+    base_rows = [
+        _goal_row(0, 0),
+        {**_goal_row(0, 0), "home_team": "Gamma FC", "away_team": "Delta FC"},
+        {**_goal_row(0, 0), "home_team": "Alpha", "away_team": "Beta"},
+    ]
+    candidate_rows = [
+        {**_espn_row(0, 0), "home_team": "Delta", "away_team": "Gamma"},
+        _espn_row(0, 0),
+    ]
+    links = _match_records(base_rows, candidate_rows)
+    assert [(link.base_index, link.candidate_index, link.swapped) for link in links] == [
+        (0, 1, False),
+        (1, 0, True),
+    ]
+
+
+def test_live_score_service_close_stops_fetch_workers() -> None:
+    service = LiveScoreService(cache_seconds=0, providers=[StaticProvider("goal", [])])
+    assert service.get_scores(status="all")["count"] == 0
+    service.close()
+    with pytest.raises(RuntimeError):
+        service.get_scores(status="all")
+
+
+def test_live_score_service_coalesces_concurrent_refreshes() -> None:
+    release = threading.Event()
+    calls: list[int] = []
+
+    class SlowProvider(StaticProvider):
+        def fetch_matches(self) -> list[dict]:
+            calls.append(1)
+            release.wait(timeout=5)
+            return super().fetch_matches()
+
+    service = LiveScoreService(
+        cache_seconds=60,
+        providers=[SlowProvider("goal", [_goal_row(1, 0)])],
+    )
+    results: list[int] = []
+    threads = [
+        threading.Thread(target=lambda: results.append(service.get_scores(status="all")["count"]))
+        for _ in range(6)
+    ]
+    for thread in threads:
+        thread.start()
+    time.sleep(0.1)
+    release.set()
+    for thread in threads:
+        thread.join(timeout=5)
+    service.close()
+
+    assert results == [1] * 6
+    assert len(calls) == 1
+
+
+def test_live_score_service_normalizes_provider_text_fields() -> None:
+    raw_row = {**_goal_row(1, 0), "competition": None, "away_team": 1860}
+    del raw_row["status"]
+    service = LiveScoreService(cache_seconds=0, providers=[StaticProvider("goal", [raw_row])])
+    payload = service.get_scores(status="all")
+    assert payload["providers"]["goal"]["ok"] is True
+    row = payload["matches"][0]
+    assert row["competition"] == ""
+    assert row["away_team"] == "1860"
+    assert row["status"] == ""
+    assert service.get_scores(status="all", league="cup")["count"] == 0
+
+
+def test_live_score_service_superseded_refresh_does_not_overwrite_forced_one() -> None:
+    started = threading.Event()
+    release = threading.Event()
+    calls: list[int] = []
+
+    class SequencedProvider(StaticProvider):
+        def fetch_matches(self) -> list[dict]:
+            calls.append(1)
+            if len(calls) == 1:
+                started.set()
+                release.wait(timeout=5)
+                return [_goal_row(1, 0)]
+            return [_goal_row(2, 0)]
+
+    service = LiveScoreService(
+        cache_seconds=60,
+        providers=[SequencedProvider("goal", []), StaticProvider("espn", [])],
+    )
+    slow_results: list[dict] = []
+    slow = threading.Thread(target=lambda: slow_results.append(service.get_scores(status="all")))
+    slow.start()
+    assert started.wait(timeout=5)
+
+    forced = service.get_scores(status="all", force_refresh=True)
+    assert forced["matches"][0]["home_score"] == 2
+    release.set()
+    slow.join(timeout=5)
+    service.close()
+
+    # The slow leader still answers its own caller, but the cache keeps the forced payload.
+    assert slow_results[0]["matches"][0]["home_score"] == 1
+    cached = service._refresh_if_needed(force_refresh=False)
+    assert cached["generated_at_utc"] == forced["generated_at_utc"]
+    assert cached["matches"][0]["home_score"] == 2